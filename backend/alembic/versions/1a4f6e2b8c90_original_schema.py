@@ -0,0 +1,119 @@
+"""Original schema
+
+The tables as the first models created them: VARCHAR keys, ENUM statuses and
+plain JSON. Databases that predate Alembic already have these tables, so any
+table that exists is left alone and ``alembic upgrade head`` can start here.
+
+Revision ID: 1a4f6e2b8c90
+Revises:
+Create Date: 2026-10-15 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "1a4f6e2b8c90"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _missing(table: str) -> bool:
+    if context.is_offline_mode():
+        return True
+    return not sa.inspect(op.get_bind()).has_table(table)
+
+
+def upgrade() -> None:
+    if _missing("projects"):
+        op.create_table(
+            "projects",
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False, unique=True),
+            sa.Column("path", sa.String(), nullable=False),
+            sa.Column("meta", sa.JSON(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+        )
+    if _missing("scans"):
+        op.create_table(
+            "scans",
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("project_id", sa.String(), sa.ForeignKey("projects.id"), nullable=False),
+            sa.Column(
+                "status",
+                sa.Enum("PENDING", "RUNNING", "SUCCESS", "FAILED", name="scanstatus"),
+                nullable=True,
+            ),
+            sa.Column("tools", sa.JSON(), nullable=False),
+            sa.Column("target", sa.String(), nullable=False),
+            sa.Column("started_at", sa.DateTime(), nullable=True),
+            sa.Column("finished_at", sa.DateTime(), nullable=True),
+            sa.Column("logs", sa.Text(), nullable=True),
+        )
+    if _missing("findings"):
+        op.create_table(
+            "findings",
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("scan_id", sa.String(), sa.ForeignKey("scans.id"), nullable=False),
+            sa.Column("tool", sa.String(), nullable=False),
+            sa.Column("title", sa.String(), nullable=False),
+            sa.Column("description", sa.Text(), nullable=False),
+            sa.Column("severity", sa.String(), nullable=False),
+            sa.Column("category", sa.String(), nullable=True),
+            sa.Column("file_path", sa.String(), nullable=True),
+            sa.Column("line_number", sa.String(), nullable=True),
+            sa.Column("function", sa.String(), nullable=True),
+            sa.Column("tool_version", sa.String(), nullable=True),
+            sa.Column("input_seed", sa.String(), nullable=True),
+            sa.Column("coverage", sa.JSON(), nullable=True),
+            sa.Column("assertions", sa.JSON(), nullable=True),
+            sa.Column("raw", sa.JSON(), nullable=True),
+        )
+    if _missing("tool_executions"):
+        op.create_table(
+            "tool_executions",
+            sa.Column("id", sa.String(), primary_key=True),
+            sa.Column("scan_id", sa.String(), sa.ForeignKey("scans.id"), nullable=False),
+            sa.Column("tool", sa.String(), nullable=False),
+            sa.Column(
+                "status",
+                sa.Enum(
+                    "PENDING",
+                    "RUNNING",
+                    "RETRYING",
+                    "SUCCEEDED",
+                    "FAILED",
+                    name="toolexecutionstatus",
+                ),
+                nullable=True,
+            ),
+            sa.Column("attempt", sa.Integer(), nullable=True),
+            sa.Column("started_at", sa.DateTime(), nullable=True),
+            sa.Column("finished_at", sa.DateTime(), nullable=True),
+            sa.Column("duration_seconds", sa.Float(), nullable=True),
+            sa.Column("command", sa.JSON(), nullable=True),
+            sa.Column("exit_code", sa.Integer(), nullable=True),
+            sa.Column("stdout_path", sa.String(), nullable=True),
+            sa.Column("stderr_path", sa.String(), nullable=True),
+            sa.Column("environment", sa.JSON(), nullable=True),
+            sa.Column("artifacts_path", sa.String(), nullable=True),
+            sa.Column("error", sa.Text(), nullable=True),
+            sa.Column("parsing_error", sa.Text(), nullable=True),
+            sa.Column("failure_reason", sa.String(), nullable=True),
+            sa.Column("findings_count", sa.Integer(), nullable=True),
+            sa.Column("tool_version", sa.String(), nullable=True),
+            sa.Column("input_seed", sa.String(), nullable=True),
+            sa.Column("coverage", sa.JSON(), nullable=True),
+            sa.Column("assertions", sa.JSON(), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("tool_executions")
+    op.drop_table("findings")
+    op.drop_table("scans")
+    op.drop_table("projects")
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP TYPE IF EXISTS toolexecutionstatus")
+        op.execute("DROP TYPE IF EXISTS scanstatus")
@@ -0,0 +1,218 @@
+"""Compact keys, status codes and scan counters
+
+Brings the original schema up to the current models:
+
+* ``scans.findings_count`` (NOT NULL, backfilled from ``findings``);
+* VARCHAR primary/foreign keys become ``uuid`` on Postgres and the 32-character
+  hex form used by ``Uuid`` elsewhere;
+* the ``scanstatus``/``toolexecutionstatus`` ENUMs become single-character codes
+  (see ``app.models._STATUS_CODES``);
+* JSON columns become JSONB on Postgres;
+* ``created_at``/``started_at`` get a UTC server default;
+* the listing and lookup indexes.
+
+Databases that ``create_all`` built from the current models before they were
+stamped already have this shape (``scans.findings_count`` exists) and are left
+alone.
+
+Revision ID: 3b7e0c5a9d21
+Revises: 1a4f6e2b8c90
+Create Date: 2026-10-15 00:00:00
+"""
+from __future__ import annotations
+
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "3b7e0c5a9d21"
+down_revision = "1a4f6e2b8c90"
+branch_labels = None
+depends_on = None
+
+SCAN_STATUS_CODES = {"PENDING": "P", "RUNNING": "R", "SUCCESS": "S", "FAILED": "F"}
+TOOL_EXECUTION_STATUS_CODES = {
+    "PENDING": "P",
+    "RUNNING": "R",
+    "RETRYING": "T",
+    "SUCCEEDED": "S",
+    "FAILED": "F",
+}
+STATUS_COLUMNS = (
+    ("scans", "scanstatus", SCAN_STATUS_CODES),
+    ("tool_executions", "toolexecutionstatus", TOOL_EXECUTION_STATUS_CODES),
+)
+
+KEY_COLUMNS = (
+    ("projects", "id"),
+    ("scans", "id"),
+    ("scans", "project_id"),
+    ("findings", "id"),
+    ("findings", "scan_id"),
+    ("tool_executions", "id"),
+    ("tool_executions", "scan_id"),
+)
+# Default Postgres names for the foreign keys emitted by create_all.
+FOREIGN_KEYS = (
+    ("scans_project_id_fkey", "scans", "projects", "project_id"),
+    ("findings_scan_id_fkey", "findings", "scans", "scan_id"),
+    ("tool_executions_scan_id_fkey", "tool_executions", "scans", "scan_id"),
+)
+JSON_COLUMNS = (
+    ("projects", "meta"),
+    ("scans", "tools"),
+    ("findings", "coverage"),
+    ("findings", "assertions"),
+    ("findings", "raw"),
+    ("tool_executions", "command"),
+    ("tool_executions", "environment"),
+    ("tool_executions", "coverage"),
+    ("tool_executions", "assertions"),
+)
+TIMESTAMP_DEFAULTS = (("projects", "created_at"), ("scans", "started_at"))
+INDEXES = (
+    ("ix_projects_created_at", "projects", ["created_at", "id"]),
+    ("ix_scans_started_at", "scans", ["started_at", "id"]),
+    ("ix_scans_status", "scans", ["status"]),
+    ("ix_scans_project_id", "scans", ["project_id"]),
+    ("ix_findings_scan_severity", "findings", ["scan_id", "severity"]),
+    ("ix_findings_scan_tool", "findings", ["scan_id", "tool"]),
+    ("ix_findings_tool", "findings", ["tool"]),
+    ("ix_tool_executions_scan_tool", "tool_executions", ["scan_id", "tool", "status"]),
+)
+
+
+def _case(column: str, mapping: dict[str, str], cast: str = "") -> str:
+    whens = " ".join(f"WHEN '{old}' THEN '{new}'{cast}" for old, new in mapping.items())
+    return f"CASE {column} {whens} END"
+
+
+def _utcnow(dialect: str) -> sa.TextClause:
+    # Matches app.models.utcnow.
+    if dialect == "postgresql":
+        return sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+    return sa.text("CURRENT_TIMESTAMP")
+
+
+def _already_current() -> bool:
+    if context.is_offline_mode():
+        return False
+    columns = sa.inspect(op.get_bind()).get_columns("scans")
+    return any(column["name"] == "findings_count" for column in columns)
+
+
+def upgrade() -> None:
+    if _already_current():
+        return
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        for name, table, _, _ in FOREIGN_KEYS:
+            op.drop_constraint(name, table, type_="foreignkey")
+        for table, column in KEY_COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.Uuid(as_uuid=False),
+                postgresql_using=f"{column}::uuid",
+            )
+        for name, table, referent, column in FOREIGN_KEYS:
+            op.create_foreign_key(name, table, referent, [column], ["id"])
+
+        for table, enum_name, codes in STATUS_COLUMNS:
+            op.alter_column(
+                table,
+                "status",
+                type_=sa.String(1),
+                postgresql_using=_case("status::text", codes),
+            )
+            op.execute(f"DROP TYPE {enum_name}")
+
+        for table, column in JSON_COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSONB(),
+                postgresql_using=f"{column}::jsonb",
+            )
+
+        for table, column in TIMESTAMP_DEFAULTS:
+            op.alter_column(table, column, server_default=_utcnow(dialect))
+    else:
+        # Non-native Uuid columns hold the undashed hex form.
+        for table, column in KEY_COLUMNS:
+            op.execute(f"UPDATE {table} SET {column} = REPLACE({column}, '-', '')")
+        for table, _, codes in STATUS_COLUMNS:
+            op.execute(f"UPDATE {table} SET status = {_case('status', codes)}")
+        for table, column in TIMESTAMP_DEFAULTS:
+            with op.batch_alter_table(table) as batch:
+                batch.alter_column(column, server_default=_utcnow(dialect))
+
+    op.add_column(
+        "scans",
+        sa.Column("findings_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(
+        "UPDATE scans SET findings_count = "
+        "(SELECT COUNT(*) FROM findings WHERE findings.scan_id = scans.id)"
+    )
+
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
+    with op.batch_alter_table("scans") as batch:
+        batch.drop_column("findings_count")
+
+    if dialect == "postgresql":
+        for table, column in TIMESTAMP_DEFAULTS:
+            op.alter_column(table, column, server_default=None)
+
+        for table, column in JSON_COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSON(),
+                postgresql_using=f"{column}::json",
+            )
+
+        for table, enum_name, codes in STATUS_COLUMNS:
+            names = {code: name for name, code in codes.items()}
+            postgresql.ENUM(*codes, name=enum_name).create(op.get_bind())
+            op.alter_column(
+                table,
+                "status",
+                type_=postgresql.ENUM(*codes, name=enum_name, create_type=False),
+                postgresql_using=_case("status", names, f"::{enum_name}"),
+            )
+
+        for name, table, _, _ in FOREIGN_KEYS:
+            op.drop_constraint(name, table, type_="foreignkey")
+        for table, column in KEY_COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.String(),
+                postgresql_using=f"{column}::text",
+            )
+        for name, table, referent, column in FOREIGN_KEYS:
+            op.create_foreign_key(name, table, referent, [column], ["id"])
+    else:
+        for table, column in TIMESTAMP_DEFAULTS:
+            with op.batch_alter_table(table) as batch:
+                batch.alter_column(column, server_default=None)
+        for table, _, codes in STATUS_COLUMNS:
+            names = {code: name for name, code in codes.items()}
+            op.execute(f"UPDATE {table} SET status = {_case('status', names)}")
+        for table, column in KEY_COLUMNS:
+            op.execute(
+                f"UPDATE {table} SET {column} = "
+                f"SUBSTR({column}, 1, 8) || '-' || SUBSTR({column}, 9, 4) || '-' || "
+                f"SUBSTR({column}, 13, 4) || '-' || SUBSTR({column}, 17, 4) || '-' || "
+                f"SUBSTR({column}, 21)"
+            )
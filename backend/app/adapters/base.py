@@ -1,15 +1,37 @@
 from __future__ import annotations
 
+import fcntl
+import io
+import json
 import os
+import re
+import shutil
 import subprocess
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import datetime
+from decimal import Decimal
 from functools import lru_cache
 from pathlib import Path
-from typing import List
+from tempfile import SpooledTemporaryFile
+from typing import Any, BinaryIO, Iterator, List
 
+import ijson
 
-@dataclass
+from app.config import get_settings
+
+_SPOOL_MAX_BYTES = 1 << 20
+# ToolResult.output only holds the start of stdout; parsers stream the full log.
+_OUTPUT_HEAD_BYTES = 64 << 10
+_VERSION_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tool-version")
+_JSON_START = re.compile(r"\s*[\[{]")
+
+JSON_ERRORS: tuple[type[Exception], ...] = (ValueError, ijson.JSONError)
+
+
+@dataclass(slots=True)
 class ToolResult:
     success: bool
     output: str
@@ -35,6 +57,68 @@ def _safe_read(path: Path) -> str:
         return ""
 
 
+def _read_head(path: Path, limit: int = _OUTPUT_HEAD_BYTES) -> str:
+    try:
+        with path.open("rb") as fh:
+            return fh.read(limit).decode("utf-8", "replace")
+    except OSError:
+        return ""
+
+
+def _read_spooled(handle: SpooledTemporaryFile) -> str:
+    handle.seek(0)
+    return handle.read().decode("utf-8", "replace")
+
+
+def _prepare_log_dir(log_dir: str | Path | None) -> Path:
+    log_dir_path = Path(log_dir or Path.cwd() / "logs")
+    log_dir_path.mkdir(parents=True, exist_ok=True)
+    return log_dir_path
+
+
+def _build_environment(env: dict[str, str] | None) -> dict[str, str] | None:
+    # With no overrides the child simply inherits the parent environment.
+    return {**os.environ, **env} if env else None
+
+
+def _open_log(path: Path | None):
+    return path.open("wb") if path else nullcontext(subprocess.DEVNULL)
+
+
+def _build_result(
+    cmd: List[str],
+    log_dir_path: Path,
+    stdout_path: Path | None,
+    environment: dict[str, str] | None,
+    started_at: datetime,
+    start_ns: int,
+    *,
+    return_code: int | None,
+    error: str | None = None,
+    failure_reason: str | None = None,
+) -> ToolResult:
+    finished_at = datetime.utcnow()
+    stderr_path = log_dir_path / "stderr.log"
+    if return_code is not None:
+        error = _safe_read(stderr_path) or None
+        failure_reason = None if return_code == 0 else "non-zero-exit"
+    return ToolResult(
+        success=return_code == 0,
+        output=_read_head(stdout_path) if stdout_path else "",
+        error=error,
+        return_code=return_code,
+        command=cmd,
+        stdout_path=str(stdout_path) if stdout_path else None,
+        stderr_path=str(stderr_path),
+        environment=environment,
+        started_at=started_at,
+        finished_at=finished_at,
+        duration_seconds=(time.monotonic_ns() - start_ns) / 1e9,
+        artifacts_path=str(log_dir_path),
+        failure_reason=failure_reason,
+    )
+
+
 def run_command(
     cmd: List[str],
     timeout: int = 600,
@@ -42,89 +126,172 @@ def run_command(
     workdir: str | Path | None = None,
     log_dir: str | Path | None = None,
     max_runtime: int | None = None,
+    capture_stdout: bool = True,
 ) -> ToolResult:
-    log_dir_path = Path(log_dir or Path.cwd() / "logs")
-    log_dir_path.mkdir(parents=True, exist_ok=True)
-    stdout_path = log_dir_path / "stdout.log"
-    stderr_path = log_dir_path / "stderr.log"
-
-    environment = os.environ.copy()
-    environment.update(env or {})
+    log_dir_path = _prepare_log_dir(log_dir)
+    stdout_path = log_dir_path / "stdout.log" if capture_stdout else None
+    environment = dict(env) if env else None
 
     started_at = datetime.utcnow()
+    start_ns = time.monotonic_ns()
     try:
-        with stdout_path.open("w") as stdout, stderr_path.open("w") as stderr:
+        with (
+            _open_log(stdout_path) as stdout,
+            (log_dir_path / "stderr.log").open("wb") as stderr,
+        ):
             proc = subprocess.run(
                 cmd,
                 stdout=stdout,
                 stderr=stderr,
-                text=True,
                 timeout=max_runtime or timeout,
                 check=False,
                 cwd=workdir,
-                env=environment,
+                env=_build_environment(env),
             )
-        finished_at = datetime.utcnow()
-        output = _safe_read(stdout_path)
-        error_output = _safe_read(stderr_path)
-        return ToolResult(
-            success=proc.returncode == 0,
-            output=output,
-            error=error_output or None,
-            return_code=proc.returncode,
-            command=cmd,
-            stdout_path=str(stdout_path),
-            stderr_path=str(stderr_path),
-            environment=environment,
-            started_at=started_at,
-            finished_at=finished_at,
-            duration_seconds=(finished_at - started_at).total_seconds(),
-            artifacts_path=str(log_dir_path),
-            failure_reason=None if proc.returncode == 0 else "non-zero-exit",
-        )
     except subprocess.TimeoutExpired:
-        finished_at = datetime.utcnow()
-        return ToolResult(
-            success=False,
-            output=_safe_read(stdout_path),
-            error="timeout",
+        return _build_result(
+            cmd,
+            log_dir_path,
+            stdout_path,
+            environment,
+            started_at,
+            start_ns,
             return_code=None,
-            command=cmd,
-            stdout_path=str(stdout_path),
-            stderr_path=str(stderr_path),
-            environment=environment,
-            started_at=started_at,
-            finished_at=finished_at,
-            duration_seconds=(finished_at - started_at).total_seconds(),
-            artifacts_path=str(log_dir_path),
+            error="timeout",
             failure_reason="timeout",
         )
     except OSError as exc:
-        finished_at = datetime.utcnow()
-        return ToolResult(
-            success=False,
-            output=_safe_read(stdout_path),
-            error=str(exc),
+        return _build_result(
+            cmd,
+            log_dir_path,
+            stdout_path,
+            environment,
+            started_at,
+            start_ns,
             return_code=None,
-            command=cmd,
-            stdout_path=str(stdout_path),
-            stderr_path=str(stderr_path),
-            environment=environment,
-            started_at=started_at,
-            finished_at=finished_at,
-            duration_seconds=(finished_at - started_at).total_seconds(),
-            artifacts_path=str(log_dir_path),
+            error=str(exc),
             failure_reason="crash",
         )
+    return _build_result(
+        cmd,
+        log_dir_path,
+        stdout_path,
+        environment,
+        started_at,
+        start_ns,
+        return_code=proc.returncode,
+    )
 
 
-@lru_cache(maxsize=32)
-def detect_tool_version(binary: str) -> str | None:
+def open_output(result: ToolResult) -> BinaryIO:
+    if result.stdout_path and Path(result.stdout_path).is_file():
+        return open(result.stdout_path, "rb")
+    return io.BytesIO((result.output or "").encode())
+
+
+def check_json_output(result: ToolResult) -> bool:
+    """Return whether the tool output can be JSON, recording a parse error on the
+    result when it clearly is not (e.g. a tool that failed early with plain text)."""
+    if _JSON_START.match(result.output or ""):
+        return True
+    result.parsing_error = "Tool output is not JSON"
+    result.failure_reason = result.failure_reason or "parse-error"
+    return False
+
+
+def _decimals_to_float(value: Any) -> Any:
+    # ijson yields exact ints (uint256 values included) but Decimal for fractional
+    # numbers; convert those to float so items match what json.loads would return.
+    if type(value) is dict:
+        return {key: _decimals_to_float(item) for key, item in value.items()}
+    if type(value) is list:
+        return [_decimals_to_float(item) for item in value]
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def iter_json_items(result: ToolResult, prefix: str) -> Iterator[Any]:
+    """Yield the array items at ``prefix`` (ijson notation, e.g. ``errors.item``) of a
+    tool's JSON stdout, streaming from the log file rather than ``result.output``.
+
+    Raises one of ``JSON_ERRORS`` when the output is not valid JSON.
+    """
+    with open_output(result) as source:
+        # Not use_float=True: the yajl2_c backend then rejects integers wider than
+        # 64 bits, which contract tools print routinely.
+        for item in ijson.items(source, prefix):
+            yield _decimals_to_float(item)
+
+
+def _binary_fingerprint(binary: str) -> str | None:
+    resolved = shutil.which(binary)
+    if not resolved:
+        return None
     try:
-        proc = subprocess.run(
-            [binary, "--version"], capture_output=True, text=True, timeout=10, check=False
-        )
-        output = (proc.stdout or proc.stderr or "").strip()
+        stat = os.stat(resolved)
+    except OSError:
+        return None
+    return f"{resolved}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _load_version_cache(path: Path) -> dict[str, str]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _store_version_cache(path: Path, key: str, version: str) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.with_suffix(".lock").open("w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            cache = _load_version_cache(path)
+            cache[key] = version
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(cache))
+            os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _probe_tool_version(binary: str) -> str | None:
+    try:
+        with SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES) as stdout, SpooledTemporaryFile(
+            max_size=_SPOOL_MAX_BYTES
+        ) as stderr:
+            subprocess.run(
+                [binary, "--version"], stdout=stdout, stderr=stderr, timeout=10, check=False
+            )
+            output = (_read_spooled(stdout) or _read_spooled(stderr)).strip()
         return output.splitlines()[0] if output else None
     except OSError:
         return None
+
+
+def detect_tool_version(binary: str) -> str | None:
+    # Keyed on the binary's path, mtime and size so an upgraded tool is re-probed
+    # without restarting the worker; stat() is far cheaper than spawning it.
+    return _detect_tool_version(binary, _binary_fingerprint(binary))
+
+
+@lru_cache(maxsize=32)
+def _detect_tool_version(binary: str, fingerprint: str | None) -> str | None:
+    cache_path = Path(get_settings().tool_version_cache_path)
+    if fingerprint:
+        cached = _load_version_cache(cache_path).get(fingerprint)
+        if cached:
+            return cached
+
+    version = _probe_tool_version(binary)
+    if fingerprint and version:
+        _store_version_cache(cache_path, fingerprint, version)
+    return version
+
+
+def start_version_detection(binary: str) -> Future[str | None]:
+    """Run :func:`detect_tool_version` in the background so it overlaps with the
+    tool invocation itself; call ``.result()`` once the tool has finished."""
+    return _VERSION_EXECUTOR.submit(detect_tool_version, binary)
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import List
 
-from app.adapters.base import ToolResult, detect_tool_version, run_command
+from app.adapters.base import (
+    JSON_ERRORS,
+    ToolResult,
+    check_json_output,
+    iter_json_items,
+    run_command,
+    start_version_detection,
+)
 from app.config import ToolSettings, get_settings
 from app.normalization.findings import NormalizedFinding
 
@@ -20,9 +26,11 @@ def run_echidna(
     log_dir: Path,
     env: dict[str, str],
 ) -> tuple[ToolResult, List[NormalizedFinding]]:
-    cmd = [settings.echidna_path, target, "--format", "json"]
+    echidna_path = settings.echidna_path
+    cmd = [echidna_path, target, "--format", "json"]
     if config.fuzz_duration_seconds:
         cmd.extend(["--test-duration", str(config.fuzz_duration_seconds)])
+    tool_version = start_version_detection(echidna_path)
     result = run_command(
         cmd,
         timeout=config.timeout_seconds,
@@ -31,29 +39,28 @@ def run_echidna(
         log_dir=log_dir,
         max_runtime=config.max_runtime_seconds or config.fuzz_duration_seconds,
     )
-    result.tool_version = detect_tool_version(settings.echidna_path)
+    result.tool_version = tool_version.result()
     findings: List[NormalizedFinding] = []
-    if result.success and result.output:
+    if result.success and result.output and check_json_output(result):
         try:
-            data = json.loads(result.output)
-            for issue in data.get("errors", []):
-                findings.append(
-                    NormalizedFinding(
-                        tool="echidna",
-                        title=issue.get("test", "echidna failure"),
-                        description=issue.get("message", ""),
-                        severity="HIGH",
-                        category="property-violation",
-                        file_path=issue.get("contract"),
-                        line_number=str(issue.get("line", "?")),
-                        function=issue.get("property"),
-                        raw=issue,
-                        tool_version=result.tool_version,
-                        input_seed=issue.get("seed"),
-                        assertions=issue.get("property"),
-                    )
+            findings = [
+                NormalizedFinding(
+                    tool="echidna",
+                    title=issue.get("test", "echidna failure"),
+                    description=issue.get("message", ""),
+                    severity="HIGH",
+                    category="property-violation",
+                    file_path=issue.get("contract"),
+                    line_number=str(issue.get("line", "?")),
+                    function=(property_name := issue.get("property")),
+                    raw=issue,
+                    tool_version=result.tool_version,
+                    input_seed=issue.get("seed"),
+                    assertions=property_name,
                 )
-        except json.JSONDecodeError as exc:
+                for issue in iter_json_items(result, "errors.item")
+            ]
+        except JSON_ERRORS as exc:
             result.parsing_error = str(exc)
             result.failure_reason = result.failure_reason or "parse-error"
     return result, findings
\ No newline at end of file
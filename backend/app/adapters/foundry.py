@@ -4,7 +4,7 @@ import json
 from pathlib import Path
 from typing import Iterable, List
 
-from app.adapters.base import ToolResult, detect_tool_version, run_command
+from app.adapters.base import ToolResult, open_output, run_command, start_version_detection
 from app.config import ToolSettings, get_settings
 from app.normalization.findings import NormalizedFinding
 
@@ -15,13 +15,16 @@ _FAILURE_STATUSES = {"fail", "failed", "failure", "error", "panic"}
 
 
 def _iter_dicts(obj: object) -> Iterable[dict]:
-    if isinstance(obj, dict):
-        yield obj
-        for value in obj.values():
-            yield from _iter_dicts(value)
-    elif isinstance(obj, list):
-        for item in obj:
-            yield from _iter_dicts(item)
+    # Depth-first pre-order walk with an explicit stack; children are pushed
+    # in reverse so dicts are yielded in document order.
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if type(node) is dict:
+            yield node
+            stack.extend(reversed(node.values()))
+        elif type(node) is list:
+            stack.extend(reversed(node))
 
 
 def _extract_findings(payload: object, tool_version: str | None) -> List[NormalizedFinding]:
@@ -57,17 +60,19 @@ def _extract_findings(payload: object, tool_version: str | None) -> List[Normali
     return findings
 
 
-def _parse_foundry_output(output: str, tool_version: str | None) -> List[NormalizedFinding]:
+def _parse_foundry_output(result: ToolResult) -> List[NormalizedFinding]:
     findings: List[NormalizedFinding] = []
-    for line in output.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            payload = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        findings.extend(_extract_findings(payload, tool_version))
+    with open_output(result) as source:
+        for line in source:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                # stdlib json keeps uint256 integers exact (orjson would yield floats)
+                payload = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            findings.extend(_extract_findings(payload, result.tool_version))
     return findings
 
 
@@ -93,6 +98,7 @@ def run_foundry(
     if target_path.is_file():
         cmd.extend(["--match-path", str(target_path)])
 
+    tool_version = start_version_detection(settings.foundry_path)
     result = run_command(
         cmd,
         timeout=config.timeout_seconds,
@@ -102,8 +108,8 @@ def run_foundry(
         max_runtime=config.max_runtime_seconds,
     )
 
-    result.tool_version = detect_tool_version(settings.foundry_path)
-    findings = _parse_foundry_output(result.output or "", result.tool_version)
+    result.tool_version = tool_version.result()
+    findings = _parse_foundry_output(result)
 
     if not findings and not result.success:
         result.failure_reason = result.failure_reason or "command-failed"
@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import List
 
-from app.adapters.base import ToolResult, detect_tool_version, run_command
+from app.adapters.base import ToolResult, run_command, start_version_detection
 from app.config import ToolSettings, get_settings
 from app.normalization.findings import NormalizedFinding
 
@@ -19,6 +19,7 @@ def run_manticore(
     env: dict[str, str],
 ) -> tuple[ToolResult, List[NormalizedFinding]]:
     cmd = [settings.manticore_path, target]
+    tool_version = start_version_detection(settings.manticore_path)
     result = run_command(
         cmd,
         timeout=config.timeout_seconds,
@@ -26,8 +27,9 @@ def run_manticore(
         workdir=workdir,
         log_dir=log_dir,
         max_runtime=config.max_runtime_seconds,
+        capture_stdout=False,
     )
-    result.tool_version = detect_tool_version(settings.manticore_path)
+    result.tool_version = tool_version.result()
     findings: List[NormalizedFinding] = []
     if not result.success:
         failure_description = result.error or "Manticore failed"
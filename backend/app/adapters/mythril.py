@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import List
 
-from app.adapters.base import ToolResult, detect_tool_version, run_command
+from app.adapters.base import (
+    JSON_ERRORS,
+    ToolResult,
+    check_json_output,
+    iter_json_items,
+    run_command,
+    start_version_detection,
+)
 from app.config import ToolSettings, get_settings
-from app.normalization.findings import NormalizedFinding
+from app.normalization.findings import NormalizedFinding, intern_label, normalize_severity
 
 
 settings = get_settings()
@@ -21,6 +27,7 @@ def run_mythril(
     env: dict[str, str],
 ) -> tuple[ToolResult, List[NormalizedFinding]]:
     cmd = [settings.mythril_path, "analyze", target, "-o", "json"]
+    tool_version = start_version_detection(settings.mythril_path)
     result = run_command(
         cmd,
         timeout=config.timeout_seconds,
@@ -29,27 +36,26 @@ def run_mythril(
         log_dir=log_dir,
         max_runtime=config.max_runtime_seconds,
     )
-    result.tool_version = detect_tool_version(settings.mythril_path)
+    result.tool_version = tool_version.result()
     findings: List[NormalizedFinding] = []
-    if result.success and result.output:
+    if result.success and result.output and check_json_output(result):
         try:
-            data = json.loads(result.output)
-            for issue in data.get("issues", []):
-                findings.append(
-                    NormalizedFinding(
-                        tool="mythril",
-                        title=issue.get("title", "mythril finding"),
-                        description=issue.get("description", ""),
-                        severity=issue.get("severity", "INFO").upper(),
-                        category=issue.get("swcID"),
-                        file_path=issue.get("filename"),
-                        line_number=str(issue.get("lineno", "?")),
-                        function=issue.get("function"),
-                        raw=issue,
-                        tool_version=result.tool_version,
-                    )
+            findings = [
+                NormalizedFinding(
+                    tool="mythril",
+                    title=issue.get("title", "mythril finding"),
+                    description=issue.get("description", ""),
+                    severity=normalize_severity(issue.get("severity", "INFO")),
+                    category=intern_label(issue.get("swcID")),
+                    file_path=issue.get("filename"),
+                    line_number=str(issue.get("lineno", "?")),
+                    function=issue.get("function"),
+                    raw=issue,
+                    tool_version=result.tool_version,
                 )
-        except json.JSONDecodeError as exc:
+                for issue in iter_json_items(result, "issues.item")
+            ]
+        except JSON_ERRORS as exc:
             result.parsing_error = str(exc)
             result.failure_reason = result.failure_reason or "parse-error"
     return result, findings
\ No newline at end of file
@@ -1,17 +1,42 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import List
 
-from app.adapters.base import ToolResult, detect_tool_version, run_command
+from app.adapters.base import (
+    JSON_ERRORS,
+    ToolResult,
+    check_json_output,
+    iter_json_items,
+    run_command,
+    start_version_detection,
+)
 from app.config import ToolSettings, get_settings
-from app.normalization.findings import NormalizedFinding
+from app.normalization.findings import NormalizedFinding, intern_label, normalize_severity
 
 
 settings = get_settings()
 
 
+def _to_finding(issue: dict, tool_version: str | None) -> NormalizedFinding:
+    first_element = (issue.get("elements") or [{}])[0]
+    source_mapping = first_element.get("source_mapping") or {}
+    lines = source_mapping.get("lines") or ["?"]
+    check = intern_label(issue.get("check"))
+    return NormalizedFinding(
+        tool="slither",
+        title=check or "slither finding",
+        description=issue.get("description", ""),
+        severity=normalize_severity(issue.get("impact", "INFO")),
+        category=check,
+        file_path=source_mapping.get("filename_relative"),
+        line_number=str(lines[0]),
+        function=first_element.get("type"),
+        raw=issue,
+        tool_version=tool_version,
+    )
+
+
 def run_slither(
     target: str,
     *,
@@ -21,6 +46,7 @@ def run_slither(
     env: dict[str, str],
 ) -> tuple[ToolResult, List[NormalizedFinding]]:
     cmd = [settings.slither_path, target, "--json", "-"]
+    tool_version = start_version_detection(settings.slither_path)
     result = run_command(
         cmd,
         timeout=config.timeout_seconds,
@@ -29,27 +55,15 @@ def run_slither(
         log_dir=log_dir,
         max_runtime=config.max_runtime_seconds,
     )
-    result.tool_version = detect_tool_version(settings.slither_path)
+    result.tool_version = tool_version.result()
     findings: List[NormalizedFinding] = []
-    if result.success and result.output:
+    if result.success and result.output and check_json_output(result):
         try:
-            data = json.loads(result.output)
-            for issue in data.get("results", {}).get("detectors", []):
-                findings.append(
-                    NormalizedFinding(
-                        tool="slither",
-                        title=issue.get("check", "slither finding"),
-                        description=issue.get("description", ""),
-                        severity=issue.get("impact", "INFO").upper(),
-                        category=issue.get("check"),
-                        file_path=issue.get("elements", [{}])[0].get("source_mapping", {}).get("filename_relative"),
-                        line_number=str(issue.get("elements", [{}])[0].get("source_mapping", {}).get("lines", ["?"])[0]),
-                        function=issue.get("elements", [{}])[0].get("type"),
-                        raw=issue,
-                        tool_version=result.tool_version,
-                    )
-                )
-        except json.JSONDecodeError as exc:
+            findings = [
+                _to_finding(issue, result.tool_version)
+                for issue in iter_json_items(result, "results.detectors.item")
+            ]
+        except JSON_ERRORS as exc:
             result.parsing_error = str(exc)
             result.failure_reason = result.failure_reason or "parse-error"
     return result, findings
\ No newline at end of file
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import os
 from functools import lru_cache
-from pydantic import BaseModel, Field
+from pathlib import Path
+from pydantic import BaseModel, Field, PrivateAttr
 from pydantic_settings import BaseSettings
 
 
@@ -20,6 +21,14 @@ class Settings(BaseSettings):
     database_url: str = Field(
         default="postgresql+psycopg2://postgres:postgres@db:5432/scan"
     )
+    db_pool_size: int = Field(default=20, description="Persistent connections kept per process")
+    db_max_overflow: int = Field(default=20, description="Extra connections allowed under burst load")
+    db_pool_recycle_seconds: int = Field(default=3600)
+    auto_create_schema: bool = Field(
+        default=False,
+        description="Create missing tables from the models when the API starts (local runs); "
+        "deployments apply Alembic migrations instead",
+    )
     redis_url: str = Field(default="redis://redis:6379/0")
     celery_broker_url: str = Field(default="redis://redis:6379/1")
     celery_result_backend: str = Field(default="redis://redis:6379/2")
@@ -29,6 +38,12 @@ class Settings(BaseSettings):
     manticore_path: str = Field(default=os.environ.get("MANTICORE_PATH", "manticore"))
     foundry_path: str = Field(default=os.environ.get("FOUNDRY_PATH", "forge"))
     storage_path: str = Field(default=os.environ.get("STORAGE_PATH", "storage"))
+    tool_version_cache_path: str = Field(
+        default=os.environ.get(
+            "TOOL_VERSION_CACHE_PATH",
+            str(Path.home() / ".cache" / "fuzz" / "tool_versions.json"),
+        )
+    )
     fake_results_probability: float = Field(
         default=0.15,
         description="Probability (0-1) of injecting synthetic findings to keep the UI lively",
@@ -42,13 +57,29 @@ class Settings(BaseSettings):
         }
     )
 
+    # Merged per-tool configs, stored with copies of the "default" and tool entries
+    # they were derived from, so replacing or editing either one in place misses.
+    _tool_config_cache: dict[str, tuple[ToolSettings, ToolSettings | None, ToolSettings]] = PrivateAttr(
+        default_factory=dict
+    )
+
     def get_tool_config(self, tool: str) -> ToolSettings:
         base = self.tool_settings.get("default", ToolSettings())
         specific = self.tool_settings.get(tool)
+        cached = self._tool_config_cache.get(tool)
+        if cached and cached[0] == base and cached[1] == specific:
+            return cached[2]
+
+        config = base
         if specific:
             merged = {**base.model_dump(), **specific.model_dump(exclude_none=True)}
-            return ToolSettings(**merged)
-        return base
+            config = ToolSettings(**merged)
+        self._tool_config_cache[tool] = (
+            base.model_copy(deep=True),
+            specific.model_copy(deep=True) if specific else None,
+            config,
+        )
+        return config
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection, Engine
+
+from app import models  # noqa: F401 - registers the tables on Base.metadata
+from app.db.session import Base
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+def alembic_config(connection: Connection | None = None) -> Config:
+    config = Config(str(ALEMBIC_INI))
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+def create_schema(engine: Engine) -> None:
+    """``create_all`` for local runs. A database it leaves in the current shape is
+    stamped at head, so a later ``alembic upgrade head`` does not replay revisions
+    against tables that already have them. A database holding the original
+    tables is left unstamped for ``alembic upgrade head`` to migrate."""
+    with engine.begin() as connection:
+        inspector = inspect(connection)
+        if inspector.has_table("alembic_version"):
+            Base.metadata.create_all(connection)
+            return
+        original = inspector.has_table("scans") and not any(
+            column["name"] == "findings_count" for column in inspector.get_columns("scans")
+        )
+        Base.metadata.create_all(connection)
+        if not original:
+            command.stamp(alembic_config(connection), "head")
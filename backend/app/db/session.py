@@ -1,11 +1,52 @@
 from __future__ import annotations
 
+import json
+from typing import Any
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from app.config import get_settings
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _json_serializer(value: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits (uint256 values in raw tool output)
+            pass
+    return json.dumps(value)
+
+
+# Deserialise with the stdlib: orjson reads integers beyond 64 bits back as floats.
+_json_deserializer = json.loads
+
+
+def _pool_options(database_url: str) -> dict[str, Any]:
+    options: dict[str, Any] = {
+        "pool_pre_ping": True,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+    }
+    # SQLite (used in tests and local runs) does not use a sized QueuePool.
+    if make_url(database_url).get_backend_name() != "sqlite":
+        options.update(pool_size=settings.db_pool_size, max_overflow=settings.db_max_overflow)
+    return options
+
+
 settings = get_settings()
-engine = create_engine(settings.database_url, future=True)
+engine = create_engine(
+    settings.database_url,
+    future=True,
+    **_pool_options(settings.database_url),
+    json_serializer=_json_serializer,
+    json_deserializer=_json_deserializer,
+)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 Base = declarative_base()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator
+
+from fastapi import HTTPException, Query
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query as OrmQuery, Session
+
+from app.db.session import SessionLocal
+
+
+def get_db() -> Iterator[Session]:
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@dataclass
+class KeysetPage:
+    """Newest-first keyset pagination: pass the last row's timestamp and id back
+    as ``before``/``before_id`` to fetch the next page without an OFFSET scan.
+
+    List endpoints return at most ``limit`` rows (default 100), so clients must
+    keep following the cursor until a page shorter than ``limit`` comes back."""
+
+    limit: int
+    before: datetime | None = None
+    before_id: uuid.UUID | None = None
+
+    def apply(self, query: OrmQuery, timestamp_column, id_column) -> OrmQuery:
+        if self.before is not None:
+            if self.before_id is None:
+                query = query.filter(timestamp_column < self.before)
+            else:
+                query = query.filter(
+                    or_(
+                        timestamp_column < self.before,
+                        and_(timestamp_column == self.before, id_column < str(self.before_id)),
+                    )
+                )
+        return query.order_by(timestamp_column.desc(), id_column.desc()).limit(self.limit)
+
+
+def keyset_page(
+    limit: int = Query(default=100, ge=1, le=500),
+    before: datetime | None = Query(default=None),
+    before_id: uuid.UUID | None = Query(default=None),
+) -> KeysetPage:
+    if before_id is not None and before is None:
+        raise HTTPException(status_code=422, detail="before_id requires before")
+    return KeysetPage(limit=limit, before=before, before_id=before_id)
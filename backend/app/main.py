@@ -2,18 +2,16 @@ from __future__ import annotations
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
 from app.config import get_settings
-from app.db.session import Base
+from app.db.migrations import create_schema
+from app.db.session import engine
 from app.routes import projects, scans, findings
 
 settings = get_settings()
 
-engine = create_engine(settings.database_url, future=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
-Base.metadata.create_all(engine)
+if settings.auto_create_schema:
+    create_schema(engine)
 
 app = FastAPI(title="Smart Contract Scanner")
 
@@ -1,13 +1,76 @@
 from __future__ import annotations
 
+import os
+import sys
+import time
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Enum, ForeignKey, JSON, Text, Integer, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, JSON, Text, Integer, Float, Uuid
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import TypeDecorator
 import enum
 
 from app.db.session import Base
 
+# Binary JSON on Postgres (smaller, no reparsing on read); plain JSON elsewhere.
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+class InternedString(TypeDecorator):
+    """String column for low-cardinality labels; loaded values are interned so
+    rows share one object per distinct label."""
+
+    impl = String
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        return sys.intern(value) if value else value
+
+
+class UUIDString(TypeDecorator):
+    """UUID key exposed to Python as a string: native ``uuid`` on Postgres,
+    CHAR(32) elsewhere. Malformed ids raise ``ValueError`` rather than binding as
+    NULL; the API validates ids as ``uuid.UUID`` before they reach a query."""
+
+    impl = Uuid(as_uuid=False)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return str(uuid.UUID(str(value)))
+
+
+class utcnow(FunctionElement):
+    """Current UTC time as a naive timestamp, evaluated by the database."""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    # now() is rendered in the session TimeZone; pin it to UTC like datetime.utcnow().
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC.
+    return "CURRENT_TIMESTAMP"
+
+
+def _new_id() -> str:
+    """Return a time-ordered UUIDv7 so primary-key inserts land at the end of the index."""
+    if hasattr(uuid, "uuid7"):  # Python 3.14+
+        return str(uuid.uuid7())
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
 
 class ScanStatus(str, enum.Enum):
     PENDING = "PENDING"
@@ -24,27 +87,72 @@ class ToolExecutionStatus(str, enum.Enum):
     FAILED = "FAILED"
 
 
+_STATUS_CODES: dict[type[enum.Enum], dict[enum.Enum, str]] = {
+    ScanStatus: {
+        ScanStatus.PENDING: "P",
+        ScanStatus.RUNNING: "R",
+        ScanStatus.SUCCESS: "S",
+        ScanStatus.FAILED: "F",
+    },
+    ToolExecutionStatus: {
+        ToolExecutionStatus.PENDING: "P",
+        ToolExecutionStatus.RUNNING: "R",
+        ToolExecutionStatus.RETRYING: "T",
+        ToolExecutionStatus.SUCCEEDED: "S",
+        ToolExecutionStatus.FAILED: "F",
+    },
+}
+
+
+class StatusCode(TypeDecorator):
+    """Store a status enum as a single-character code instead of a database ENUM,
+    keeping rows and status indexes small and new states a code-only change."""
+
+    impl = String(1)
+    cache_ok = True
+
+    def __init__(self, enum_class: type[enum.Enum]):
+        super().__init__()
+        self.enum_class = enum_class
+        self._codes = _STATUS_CODES[enum_class]
+        self._members = {code: member for member, code in self._codes.items()}
+
+    def process_bind_param(self, value, dialect):
+        return self._codes[self.enum_class(value)] if value is not None else None
+
+    def process_result_value(self, value, dialect):
+        return self._members[value] if value is not None else None
+
+
 class Project(Base):
     __tablename__ = "projects"
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    __table_args__ = (Index("ix_projects_created_at", "created_at", "id"),)
+    id = Column(UUIDString, primary_key=True, default=_new_id)
     name = Column(String, unique=True, nullable=False)
     path = Column(String, nullable=False)
-    meta = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    meta = Column(JSONType, nullable=True)
+    created_at = Column(DateTime, server_default=utcnow())
 
     scans = relationship("Scan", back_populates="project", cascade="all, delete")
 
 
 class Scan(Base):
     __tablename__ = "scans"
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    project_id = Column(String, ForeignKey("projects.id"), nullable=False)
-    status = Column(Enum(ScanStatus), default=ScanStatus.PENDING)
-    tools = Column(JSON, nullable=False)
+    __table_args__ = (
+        Index("ix_scans_started_at", "started_at", "id"),
+        Index("ix_scans_status", "status"),
+    )
+    id = Column(UUIDString, primary_key=True, default=_new_id)
+    project_id = Column(UUIDString, ForeignKey("projects.id"), nullable=False, index=True)
+    status = Column(StatusCode(ScanStatus), default=ScanStatus.PENDING)
+    tools = Column(JSONType, nullable=False)
     target = Column(String, nullable=False)
-    started_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, server_default=utcnow())
     finished_at = Column(DateTime, nullable=True)
-    logs = Column(Text, nullable=True)
+    # Large payloads are only fetched by the endpoints that serialise them.
+    logs = deferred(Column(Text, nullable=True))
+    # Maintained by the scanner as findings are stored, so listings need no COUNT().
+    findings_count = Column(Integer, default=0, server_default="0", nullable=False)
 
     project = relationship("Project", back_populates="scans")
     findings = relationship("Finding", back_populates="scan", cascade="all, delete")
@@ -55,49 +163,55 @@ class Scan(Base):
 
 class Finding(Base):
     __tablename__ = "findings"
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    scan_id = Column(String, ForeignKey("scans.id"), nullable=False)
-    tool = Column(String, nullable=False)
+    __table_args__ = (
+        Index("ix_findings_scan_severity", "scan_id", "severity"),
+        Index("ix_findings_scan_tool", "scan_id", "tool"),
+        Index("ix_findings_tool", "tool"),
+    )
+    id = Column(UUIDString, primary_key=True, default=_new_id)
+    scan_id = Column(UUIDString, ForeignKey("scans.id"), nullable=False)
+    tool = Column(InternedString, nullable=False)
     title = Column(String, nullable=False)
-    description = Column(Text, nullable=False)
-    severity = Column(String, nullable=False)
-    category = Column(String, nullable=True)
+    description = deferred(Column(Text, nullable=False), group="payload")
+    severity = Column(InternedString, nullable=False)
+    category = Column(InternedString, nullable=True)
     file_path = Column(String, nullable=True)
     line_number = Column(String, nullable=True)
     function = Column(String, nullable=True)
     tool_version = Column(String, nullable=True)
     input_seed = Column(String, nullable=True)
-    coverage = Column(JSON, nullable=True)
-    assertions = Column(JSON, nullable=True)
-    raw = Column(JSON, nullable=True)
+    coverage = deferred(Column(JSONType, nullable=True), group="payload")
+    assertions = deferred(Column(JSONType, nullable=True), group="payload")
+    raw = deferred(Column(JSONType, nullable=True), group="payload")
 
     scan = relationship("Scan", back_populates="findings")
 
 
 class ToolExecution(Base):
     __tablename__ = "tool_executions"
+    __table_args__ = (Index("ix_tool_executions_scan_tool", "scan_id", "tool", "status"),)
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    scan_id = Column(String, ForeignKey("scans.id"), nullable=False)
-    tool = Column(String, nullable=False)
-    status = Column(Enum(ToolExecutionStatus), default=ToolExecutionStatus.PENDING)
+    id = Column(UUIDString, primary_key=True, default=_new_id)
+    scan_id = Column(UUIDString, ForeignKey("scans.id"), nullable=False)
+    tool = Column(InternedString, nullable=False)
+    status = Column(StatusCode(ToolExecutionStatus), default=ToolExecutionStatus.PENDING)
     attempt = Column(Integer, default=0)
     started_at = Column(DateTime, nullable=True)
     finished_at = Column(DateTime, nullable=True)
     duration_seconds = Column(Float, nullable=True)
-    command = Column(JSON, nullable=True)
+    command = Column(JSONType, nullable=True)
     exit_code = Column(Integer, nullable=True)
     stdout_path = Column(String, nullable=True)
     stderr_path = Column(String, nullable=True)
-    environment = Column(JSON, nullable=True)
+    environment = Column(JSONType, nullable=True)
     artifacts_path = Column(String, nullable=True)
     error = Column(Text, nullable=True)
     parsing_error = Column(Text, nullable=True)
-    failure_reason = Column(String, nullable=True)
+    failure_reason = Column(InternedString, nullable=True)
     findings_count = Column(Integer, default=0)
     tool_version = Column(String, nullable=True)
     input_seed = Column(String, nullable=True)
-    coverage = Column(JSON, nullable=True)
-    assertions = Column(JSON, nullable=True)
+    coverage = deferred(Column(JSONType, nullable=True), group="payload")
+    assertions = deferred(Column(JSONType, nullable=True), group="payload")
 
     scan = relationship("Scan", back_populates="tool_executions")
\ No newline at end of file
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NormalizedFinding:
     tool: str
     title: str
@@ -18,4 +20,15 @@ class NormalizedFinding:
     input_seed: Optional[str] = None
     coverage: Optional[dict[str, Any]] = None
     assertions: Optional[dict[str, Any]] = None
-    raw: Optional[dict] = None
\ No newline at end of file
+    raw: Optional[dict] = None
+
+
+@lru_cache(maxsize=64)
+def normalize_severity(value: str) -> str:
+    # Tools report severities from a handful of spellings, so the upper-cased
+    # form is memoised (and interned) rather than recomputed for every finding.
+    return sys.intern(value.upper())
+
+
+def intern_label(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
@@ -1,34 +1,28 @@
 from __future__ import annotations
 
+import uuid
+
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
 from app import models, schemas
-from app.db.session import SessionLocal
+from app.deps import get_db
 
 router = APIRouter(prefix="/findings", tags=["findings"])
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 @router.get("", response_model=list[schemas.FindingRead])
 def list_findings(
     db: Session = Depends(get_db),
     tool: str | None = Query(default=None),
     severity: str | None = Query(default=None),
-    scan_id: str | None = Query(default=None),
+    scan_id: uuid.UUID | None = Query(default=None),
 ):
-    query = db.query(models.Finding)
+    query = db.query(models.Finding).options(undefer_group("payload"))
     if tool:
         query = query.filter(models.Finding.tool == tool)
     if severity:
         query = query.filter(models.Finding.severity == severity)
     if scan_id:
-        query = query.filter(models.Finding.scan_id == scan_id)
+        query = query.filter(models.Finding.scan_id == str(scan_id))
     return query.all()
\ No newline at end of file
@@ -1,47 +1,52 @@
 from __future__ import annotations
 
+import uuid
+
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app import models, schemas
-from app.db.session import SessionLocal
+from app.deps import KeysetPage, get_db, keyset_page
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+_PROJECT_LIST_COLUMNS = tuple(
+    getattr(models.Project, name) for name in schemas.ProjectRead.model_fields
+)
 
 
 @router.post("", response_model=schemas.ProjectRead)
 def create_project(payload: schemas.ProjectCreate, db: Session = Depends(get_db)):
-    project = models.Project(name=payload.name, path=payload.path, meta=payload.meta)
-    db.add(project)
+    project = db.scalars(
+        insert(models.Project)
+        .values(name=payload.name, path=payload.path, meta=payload.meta)
+        .returning(models.Project)
+    ).one()
+    created = schemas.ProjectRead.model_validate(project)
     db.commit()
-    db.refresh(project)
-    return project
+    return created
 
 
 @router.get("", response_model=list[schemas.ProjectRead])
-def list_projects(db: Session = Depends(get_db)):
-    return db.query(models.Project).all()
+def list_projects(db: Session = Depends(get_db), page: KeysetPage = Depends(keyset_page)):
+    rows = page.apply(
+        db.query(*_PROJECT_LIST_COLUMNS), models.Project.created_at, models.Project.id
+    )
+    return [row._asdict() for row in rows]
 
 
 @router.get("/{project_id}", response_model=schemas.ProjectRead)
-def get_project(project_id: str, db: Session = Depends(get_db)):
-    project = db.query(models.Project).filter(models.Project.id == project_id).first()
+def get_project(project_id: uuid.UUID, db: Session = Depends(get_db)):
+    project = db.get(models.Project, str(project_id))
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     return project
 
 
 @router.delete("/{project_id}")
-def delete_project(project_id: str, db: Session = Depends(get_db)):
-    project = db.query(models.Project).filter(models.Project.id == project_id).first()
+def delete_project(project_id: uuid.UUID, db: Session = Depends(get_db)):
+    project = db.get(models.Project, str(project_id))
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     db.delete(project)
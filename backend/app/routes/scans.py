@@ -1,44 +1,98 @@
 from __future__ import annotations
 
+import uuid
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, selectinload
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from sqlalchemy import bindparam, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, selectinload, undefer
 
 from app import models, schemas
-from app.db.session import SessionLocal
+from app.deps import KeysetPage, get_db, keyset_page
 from app.workers.tasks import run_scan_task
 
 router = APIRouter(prefix="/scans", tags=["scans"])
 
+# List rows are read as plain column tuples (no ORM objects or identity map).
+_SCAN_LIST_COLUMNS = tuple(getattr(models.Scan, name) for name in schemas.ScanRead.model_fields)
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-def _create_scan(db: Session, project_id: str, target: str, tools: list[str]):
-    scan = models.Scan(
-        project_id=project_id,
-        target=target,
-        tools=tools,
-        status=models.ScanStatus.PENDING,
+# Built once at import; SQLAlchemy's compiled cache then reuses the SQL per request.
+_SCAN_DETAIL_BY_ID = (
+    select(models.Scan)
+    .options(
+        undefer(models.Scan.logs),
+        selectinload(models.Scan.findings).undefer_group("payload"),
+        selectinload(models.Scan.tool_executions).undefer_group("payload"),
     )
-    db.add(scan)
+    .where(models.Scan.id == bindparam("scan_id"))
+)
+
+# Dialects whose INSERT supports ON CONFLICT DO UPDATE ... RETURNING.
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def _create_scan(
+    db: Session,
+    background: BackgroundTasks,
+    project_id: str,
+    target: str,
+    tools: list[str],
+) -> schemas.ScanRead:
+    # INSERT ... RETURNING hands back server defaults (started_at, findings_count)
+    # in the same round-trip, so no refresh SELECT is needed after the commit.
+    scan = db.scalars(
+        insert(models.Scan)
+        .values(
+            project_id=project_id,
+            target=target,
+            tools=tools,
+            status=models.ScanStatus.PENDING,
+        )
+        .returning(models.Scan)
+    ).one()
+    created = schemas.ScanRead.model_validate(scan)
     db.commit()
-    db.refresh(scan)
-    run_scan_task.delay(scan.id)
-    return scan
+    # Publish to the broker after the response has been sent.
+    background.add_task(run_scan_task.delay, created.id)
+    return created
+
+
+def _upsert_project(db: Session, payload: schemas.QuickScanProject) -> str:
+    """Create the project or overwrite its path/meta, returning its id. Uses a single
+    INSERT ... ON CONFLICT (name) where the dialect supports it; the row is committed
+    together with the scan."""
+    dialect_insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if dialect_insert is not None:
+        stmt = dialect_insert(models.Project).values(
+            name=payload.name, path=payload.path, meta=payload.meta
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[models.Project.name],
+            set_={"path": stmt.excluded.path, "meta": stmt.excluded.meta},
+        ).returning(models.Project.id)
+        return db.scalar(stmt)
+
+    project = db.query(models.Project).filter(models.Project.name == payload.name).first()
+    if not project:
+        project = models.Project(name=payload.name, path=payload.path, meta=payload.meta)
+        db.add(project)
+    else:
+        project.path = payload.path
+        project.meta = payload.meta
+    db.flush()
+    return project.id
 
 
 @router.post("", response_model=schemas.ScanRead)
-def start_scan(payload: schemas.ScanRequest, db: Session = Depends(get_db)):
+def start_scan(
+    payload: schemas.ScanRequest,
+    background: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
     project = None
 
     if payload.project_id:
-        project = db.query(models.Project).filter(models.Project.id == payload.project_id).first()
+        project = db.get(models.Project, str(payload.project_id))
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
     else:
@@ -76,51 +130,39 @@ def start_scan(payload: schemas.ScanRequest, db: Session = Depends(get_db)):
                 db.commit()
                 db.refresh(project)
 
-    scan = _create_scan(db, project.id, payload.target, payload.tools)
+    scan = _create_scan(db, background, project.id, payload.target, payload.tools)
     return scan
 
 
 @router.post("/quick", response_model=schemas.QuickScanResponse)
-def quick_scan(payload: schemas.QuickScanRequest, db: Session = Depends(get_db)):
-    project = db.query(models.Project).filter(models.Project.name == payload.project.name).first()
+def quick_scan(
+    payload: schemas.QuickScanRequest,
+    background: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
+    project_id = _upsert_project(db, payload.project)
+    scan = _create_scan(db, background, project_id, payload.target, payload.tools)
 
-    if not project:
-        project = models.Project(
-            name=payload.project.name,
-            path=payload.project.path,
-            meta=payload.project.meta,
-        )
-        db.add(project)
-        db.commit()
-        db.refresh(project)
-    else:
-        if project.path != payload.project.path or project.meta != payload.project.meta:
-            project.path = payload.project.path
-            project.meta = payload.project.meta
-            db.commit()
-            db.refresh(project)
-
-    scan = _create_scan(db, project.id, payload.target, payload.tools)
-
-    return schemas.QuickScanResponse(project_id=project.id, scan_id=scan.id)
+    return schemas.QuickScanResponse(project_id=project_id, scan_id=scan.id)
 
 
 @router.get("", response_model=list[schemas.ScanRead])
-def list_scans(db: Session = Depends(get_db)):
-    return db.query(models.Scan).order_by(models.Scan.started_at.desc()).all()
+def list_scans(db: Session = Depends(get_db), page: KeysetPage = Depends(keyset_page)):
+    rows = page.apply(db.query(*_SCAN_LIST_COLUMNS), models.Scan.started_at, models.Scan.id)
+    return [row._asdict() for row in rows]
 
 
 @router.get("/{scan_id}", response_model=schemas.ScanDetail)
-def get_scan(scan_id: str, db: Session = Depends(get_db)):
-    scan = (
-        db.query(models.Scan)
-        .options(
-            selectinload(models.Scan.findings),
-            selectinload(models.Scan.tool_executions),
-        )
-        .filter(models.Scan.id == scan_id)
-        .first()
-    )
+def get_scan(scan_id: uuid.UUID, db: Session = Depends(get_db)):
+    scan = db.scalars(_SCAN_DETAIL_BY_ID, {"scan_id": str(scan_id)}).first()
     if not scan:
         raise HTTPException(status_code=404, detail="Scan not found")
-    return scan
\ No newline at end of file
+    return scan
+
+
+@router.get("/{scan_id}/logs", response_model=schemas.ScanLogs)
+def get_scan_logs(scan_id: uuid.UUID, db: Session = Depends(get_db)):
+    scan = db.get(models.Scan, str(scan_id), options=[undefer(models.Scan.logs)])
+    if not scan:
+        raise HTTPException(status_code=404, detail="Scan not found")
+    return scan
@@ -1,11 +1,12 @@
 
 from __future__ import annotations
 
+import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from app.models import ScanStatus, ToolExecutionStatus
 
@@ -20,12 +21,11 @@ class ProjectRead(ProjectCreate):
     id: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ScanRequest(BaseModel):
-    project_id: str | None = None
+    project_id: uuid.UUID | None = None
     project_name: str | None = None
     project_path: str | None = None
     target: str | None = None
@@ -78,10 +78,16 @@ class ScanRead(BaseModel):
     target: str
     started_at: datetime
     finished_at: Optional[datetime]
+    findings_count: int = 0
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ScanLogs(BaseModel):
+    id: str
     logs: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class FindingRead(BaseModel):
@@ -101,8 +107,7 @@ class FindingRead(BaseModel):
     assertions: Optional[dict]
     raw: Optional[dict]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ToolExecutionRead(BaseModel):
@@ -129,11 +134,11 @@ class ToolExecutionRead(BaseModel):
     coverage: Optional[dict]
     assertions: Optional[dict]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ScanDetail(ScanRead):
+    logs: Optional[str]
     findings: List[FindingRead]
     tool_executions: List[ToolExecutionRead] = Field(default_factory=list)
 
@@ -11,6 +11,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import List
 
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
 
 from app import models
@@ -117,46 +118,63 @@ def _prepare_workspace(scan: models.Scan) -> tuple[Path, Path]:
 
 
 def _create_tool_records(db: Session, scan: models.Scan, workspace: Path) -> None:
-    for tool in scan.tools:
-        existing = (
-            db.query(models.ToolExecution)
-            .filter(models.ToolExecution.scan_id == scan.id, models.ToolExecution.tool == tool)
-            .first()
+    existing = set(
+        db.scalars(
+            select(models.ToolExecution.tool).where(models.ToolExecution.scan_id == scan.id)
         )
-        if existing:
-            continue
-        db.add(
-            models.ToolExecution(
-                scan_id=scan.id,
-                tool=tool,
-                status=models.ToolExecutionStatus.PENDING,
-                artifacts_path=str(workspace / tool),
-            )
+    )
+    missing = [tool for tool in dict.fromkeys(scan.tools) if tool not in existing]
+    if missing:
+        db.execute(
+            insert(models.ToolExecution),
+            [_tool_record_values(scan.id, tool, workspace) for tool in missing],
         )
     db.commit()
 
 
+def _tool_record_values(scan_id: str, tool: str, workspace: Path) -> dict:
+    values = {"scan_id": scan_id, "tool": tool, "artifacts_path": str(workspace / tool)}
+    if tool in TOOL_MAP:
+        return {**values, "status": models.ToolExecutionStatus.PENDING}
+    # Unknown tools are recorded as failed up front and never dispatched.
+    return {
+        **values,
+        "status": models.ToolExecutionStatus.FAILED,
+        "error": f"Tool {tool} not recognized",
+        "finished_at": datetime.utcnow(),
+    }
+
+
 def _store_findings(db: Session, scan_id: str, findings: List[NormalizedFinding]) -> None:
-    for f in findings:
-        db.add(
-            models.Finding(
-                scan_id=scan_id,
-                tool=f.tool,
-                title=f.title,
-                description=f.description,
-                severity=f.severity,
-                category=f.category,
-                file_path=f.file_path,
-                line_number=f.line_number,
-                function=f.function,
-                raw=f.raw,
-                tool_version=f.tool_version,
-                input_seed=f.input_seed,
-                coverage=f.coverage,
-                assertions=f.assertions,
-            )
-        )
-    db.commit()
+    if not findings:
+        return
+    db.execute(
+        insert(models.Finding),
+        [
+            {
+                "scan_id": scan_id,
+                "tool": f.tool,
+                "title": f.title,
+                "description": f.description,
+                "severity": f.severity,
+                "category": f.category,
+                "file_path": f.file_path,
+                "line_number": f.line_number,
+                "function": f.function,
+                "raw": f.raw,
+                "tool_version": f.tool_version,
+                "input_seed": f.input_seed,
+                "coverage": f.coverage,
+                "assertions": f.assertions,
+            }
+            for f in findings
+        ],
+    )
+    db.execute(
+        update(models.Scan)
+        .where(models.Scan.id == scan_id)
+        .values(findings_count=models.Scan.findings_count + len(findings))
+    )
 
 
 def _update_tool_record(
@@ -192,19 +210,12 @@ def _build_env(config: ToolSettings) -> dict[str, str]:
 def _execute_tool(scan_id: str, tool_name: str, target_path: Path, workspace: Path) -> None:
     db: Session = SessionLocal()
     try:
-        tool_fn = TOOL_MAP.get(tool_name)
+        tool_fn = TOOL_MAP[tool_name]
         tool_exec = (
             db.query(models.ToolExecution)
             .filter(models.ToolExecution.scan_id == scan_id, models.ToolExecution.tool == tool_name)
             .first()
         )
-        if not tool_fn:
-            if tool_exec:
-                tool_exec.status = models.ToolExecutionStatus.FAILED
-                tool_exec.error = f"Tool {tool_name} not recognized"
-                tool_exec.finished_at = datetime.utcnow()
-                db.commit()
-            return
 
         config = settings.get_tool_config(tool_name)
         attempts = max(1, config.retries + 1)
@@ -252,6 +263,7 @@ def _execute_tool(scan_id: str, tool_name: str, target_path: Path, workspace: Pa
 
             attempt_findings = all_findings if is_final_attempt else findings
             _update_tool_record(tool_exec, result, attempt_findings, status)
+            # Findings, the scan's counter and the tool record land in one transaction.
             db.commit()
 
             if result.success:
@@ -312,7 +324,8 @@ def execute_scan(db: Session, scan: models.Scan) -> None:
         await asyncio.gather(
             *[
                 _execute_tool_async(scan.id, tool, isolated_target, workspace)
-                for tool in scan.tools
+                for tool in dict.fromkeys(scan.tools)
+                if tool in TOOL_MAP
             ]
         )
 
@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+
+from app.adapters import base
+
+
+def _make_fake_binary(tmp_path: Path, version: str) -> Path:
+    binary = tmp_path / "fake-tool"
+    binary.write_text(f"#!/bin/sh\necho '{version}'\n")
+    binary.chmod(0o755)
+    return binary
+
+
+def test_detect_tool_version_persists_to_disk(monkeypatch, tmp_path):
+    cache_path = tmp_path / "cache" / "tool_versions.json"
+    monkeypatch.setattr(base.get_settings(), "tool_version_cache_path", str(cache_path))
+    binary = _make_fake_binary(tmp_path, "fake-tool 1.2.3")
+
+    base._detect_tool_version.cache_clear()
+    assert base.detect_tool_version(str(binary)) == "fake-tool 1.2.3"
+    assert cache_path.exists()
+
+    def fail_probe(binary: str):  # noqa: ARG001
+        raise AssertionError("version should be served from the on-disk cache")
+
+    monkeypatch.setattr(base, "_probe_tool_version", fail_probe)
+    base._detect_tool_version.cache_clear()
+    assert base.detect_tool_version(str(binary)) == "fake-tool 1.2.3"
+    base._detect_tool_version.cache_clear()
+
+
+def test_detect_tool_version_reprobes_upgraded_binary(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        base.get_settings(), "tool_version_cache_path", str(tmp_path / "tool_versions.json")
+    )
+    binary = _make_fake_binary(tmp_path, "fake-tool 1.0.0")
+    assert base.detect_tool_version(str(binary)) == "fake-tool 1.0.0"
+
+    _make_fake_binary(tmp_path, "fake-tool 2.0.0-upgraded")
+    assert base.detect_tool_version(str(binary)) == "fake-tool 2.0.0-upgraded"
+    base._detect_tool_version.cache_clear()
+
+
+def test_run_command_can_discard_stdout(tmp_path):
+    cmd = [sys.executable, "-c", "print('ignored')"]
+
+    result = base.run_command(cmd, log_dir=tmp_path, capture_stdout=False)
+
+    assert result.success is True
+    assert result.output == ""
+    assert result.stdout_path is None
+    assert not (tmp_path / "stdout.log").exists()
+
+
+def test_run_command_keeps_only_stdout_head_in_memory(tmp_path):
+    items = 20_000
+    cmd = [sys.executable, "-c", f"import json; print(json.dumps({{'xs': list(range({items}))}}))"]
+
+    result = base.run_command(cmd, log_dir=tmp_path)
+
+    assert len(result.output) == base._OUTPUT_HEAD_BYTES
+    assert Path(result.stdout_path).stat().st_size > base._OUTPUT_HEAD_BYTES
+    assert base.check_json_output(result)
+    assert sum(1 for _ in base.iter_json_items(result, "xs.item")) == items
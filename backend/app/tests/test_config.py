@@ -0,0 +1,14 @@
+from app.config import Settings, ToolSettings
+
+
+def test_tool_config_follows_in_place_changes():
+    settings = Settings(tool_settings={"default": ToolSettings(retries=1)})
+    assert settings.get_tool_config("slither").retries == 1
+
+    settings.tool_settings["default"].retries = 3
+    assert settings.get_tool_config("slither").retries == 3
+
+    settings.tool_settings["slither"] = ToolSettings(timeout_seconds=30)
+    config = settings.get_tool_config("slither")
+    assert config.timeout_seconds == 30
+    assert settings.get_tool_config("slither") is config
@@ -0,0 +1,137 @@
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+PROJECT_ID = "0190a1b2-0000-7000-8000-000000000001"
+SCAN_ID = "0190a1b2-0000-7000-8000-000000000002"
+
+# Tables as the original models created them: VARCHAR keys, enum names as status
+# values and no scans.findings_count.
+ORIGINAL_SCHEMA = (
+    "CREATE TABLE projects (id VARCHAR PRIMARY KEY, name VARCHAR NOT NULL UNIQUE, "
+    "path VARCHAR NOT NULL, meta JSON, created_at DATETIME)",
+    "CREATE TABLE scans (id VARCHAR PRIMARY KEY, project_id VARCHAR NOT NULL REFERENCES projects (id), "
+    "status VARCHAR(7), tools JSON NOT NULL, target VARCHAR NOT NULL, started_at DATETIME, "
+    "finished_at DATETIME, logs TEXT)",
+    "CREATE TABLE findings (id VARCHAR PRIMARY KEY, scan_id VARCHAR NOT NULL REFERENCES scans (id), "
+    "tool VARCHAR NOT NULL, title VARCHAR NOT NULL, description TEXT NOT NULL, severity VARCHAR NOT NULL, "
+    "category VARCHAR, file_path VARCHAR, line_number VARCHAR, function VARCHAR, tool_version VARCHAR, "
+    "input_seed VARCHAR, coverage JSON, assertions JSON, raw JSON)",
+    "CREATE TABLE tool_executions (id VARCHAR PRIMARY KEY, scan_id VARCHAR NOT NULL REFERENCES scans (id), "
+    "tool VARCHAR NOT NULL, status VARCHAR(9), attempt INTEGER, started_at DATETIME, finished_at DATETIME, "
+    "duration_seconds FLOAT, command JSON, exit_code INTEGER, stdout_path VARCHAR, stderr_path VARCHAR, "
+    "environment JSON, artifacts_path VARCHAR, error TEXT, parsing_error TEXT, failure_reason VARCHAR, "
+    "findings_count INTEGER, tool_version VARCHAR, input_seed VARCHAR, coverage JSON, assertions JSON)",
+)
+
+
+def upgrade_head(url: str) -> None:
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("sqlalchemy.url", url)
+    command.upgrade(config, "head")
+
+
+def test_upgrade_migrates_original_schema(tmp_path: Path):
+    # Imported here so collecting this module does not build the app engine
+    # before test_routes_scans points DATABASE_URL at SQLite.
+    from app import models
+
+    url = f"sqlite:///{tmp_path / 'legacy.db'}"
+    engine = create_engine(url, future=True)
+    with engine.begin() as conn:
+        for statement in ORIGINAL_SCHEMA:
+            conn.execute(text(statement))
+        conn.execute(text(f"INSERT INTO projects (id, name, path) VALUES ('{PROJECT_ID}', 'legacy', '/tmp')"))
+        conn.execute(
+            text(
+                "INSERT INTO scans (id, project_id, status, tools, target) "
+                f"VALUES ('{SCAN_ID}', '{PROJECT_ID}', 'SUCCESS', '[\"slither\"]', 'A.sol')"
+            )
+        )
+        for index in range(2):
+            conn.execute(
+                text(
+                    "INSERT INTO findings (id, scan_id, tool, title, description, severity) "
+                    f"VALUES ('0190a1b2-0000-7000-8000-00000000001{index}', '{SCAN_ID}', "
+                    "'slither', 't', 'd', 'High')"
+                )
+            )
+        conn.execute(
+            text(
+                "INSERT INTO tool_executions (id, scan_id, tool, status) "
+                f"VALUES ('0190a1b2-0000-7000-8000-000000000020', '{SCAN_ID}', 'slither', 'RETRYING')"
+            )
+        )
+
+    upgrade_head(url)
+
+    Session = sessionmaker(bind=engine, future=True)
+    with Session() as db:
+        scan = db.get(models.Scan, SCAN_ID)
+        assert scan.project.id == PROJECT_ID
+        assert scan.status == models.ScanStatus.SUCCESS
+        assert scan.findings_count == 2
+        assert len(scan.findings) == 2
+        assert scan.tool_executions[0].status == models.ToolExecutionStatus.RETRYING
+
+        project = models.Project(name="fresh", path="/tmp")
+        db.add(project)
+        db.commit()
+        assert project.created_at is not None
+    engine.dispose()
+
+
+def test_upgrade_builds_empty_database(tmp_path: Path):
+    from app import models
+
+    url = f"sqlite:///{tmp_path / 'empty.db'}"
+    upgrade_head(url)
+
+    engine = create_engine(url, future=True)
+    with sessionmaker(bind=engine, future=True)() as db:
+        db.add(models.Project(id=PROJECT_ID, name="fresh", path="/tmp"))
+        db.add(models.Scan(id=SCAN_ID, project_id=PROJECT_ID, target="A.sol", tools=["slither"]))
+        db.commit()
+        scan = db.get(models.Scan, SCAN_ID)
+        assert scan.status == models.ScanStatus.PENDING
+        assert scan.findings_count == 0
+    engine.dispose()
+
+
+def test_upgrade_after_create_schema_is_a_no_op(tmp_path: Path):
+    from app import models
+    from app.db.migrations import create_schema
+    from app.db.session import Base
+
+    for name, stamp in (("stamped.db", True), ("unstamped.db", False)):
+        url = f"sqlite:///{tmp_path / name}"
+        engine = create_engine(url, future=True)
+        if stamp:
+            create_schema(engine)
+        else:
+            Base.metadata.create_all(engine)
+        with sessionmaker(bind=engine, future=True)() as db:
+            db.add(models.Project(id=PROJECT_ID, name="current", path="/tmp"))
+            db.add(
+                models.Scan(
+                    id=SCAN_ID,
+                    project_id=PROJECT_ID,
+                    target="A.sol",
+                    tools=["slither"],
+                    status=models.ScanStatus.SUCCESS,
+                )
+            )
+            db.commit()
+
+        upgrade_head(url)
+
+        with sessionmaker(bind=engine, future=True)() as db:
+            assert db.get(models.Scan, SCAN_ID).status == models.ScanStatus.SUCCESS
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT version_num FROM alembic_version")).scalar() == "3b7e0c5a9d21"
+        engine.dispose()
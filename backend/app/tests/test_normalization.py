@@ -1,6 +1,7 @@
 from pathlib import Path
 
-from app.adapters import slither
+from app.adapters import echidna, foundry, mythril, slither
+from app.adapters.base import ToolResult
 from app.config import ToolSettings
 from app.normalization.findings import NormalizedFinding
 
@@ -37,3 +38,107 @@ def test_slither_parse_handles_bad_json(monkeypatch, tmp_path):
     assert result.success is True
     assert result.parsing_error is not None
     assert findings == []
+
+
+def test_echidna_streams_findings_from_stdout_log(monkeypatch, tmp_path):
+    stdout_path = tmp_path / "stdout.log"
+    stdout_path.write_text(
+        '{"errors": [{"test": "echidna_balance", "message": "violated", "property": "balance", "seed": "7"}]}'
+    )
+
+    def fake_run_command(cmd, timeout=10, env=None, workdir=None, log_dir=None, max_runtime=None):  # noqa: ARG001
+        return ToolResult(
+            success=True,
+            output=stdout_path.read_text(),
+            command=cmd,
+            stdout_path=str(stdout_path),
+            artifacts_path=str(tmp_path),
+        )
+
+    monkeypatch.setattr(echidna, "run_command", fake_run_command)
+    result, findings = echidna.run_echidna(
+        "/tmp/file.sol",
+        config=ToolSettings(),
+        workdir=tmp_path,
+        log_dir=tmp_path,
+        env={},
+    )
+    assert result.parsing_error is None
+    assert [f.title for f in findings] == ["echidna_balance"]
+    assert findings[0].input_seed == "7"
+
+
+def test_slither_reads_first_element_source_mapping(monkeypatch, tmp_path):
+    output = (
+        '{"results": {"detectors": ['
+        '{"check": "reentrancy-eth", "impact": "High", "description": "d", "elements": '
+        '[{"type": "function", "source_mapping": {"filename_relative": "A.sol", "lines": [12, 13]}}]},'
+        '{"check": "naming", "impact": "Informational", "description": "n", "elements": []}'
+        "]}}"
+    )
+
+    def fake_run_command(cmd, timeout=10, env=None, workdir=None, log_dir=None, max_runtime=None):  # noqa: ARG001
+        return ToolResult(success=True, output=output, command=cmd)
+
+    monkeypatch.setattr(slither, "run_command", fake_run_command)
+    result, findings = slither.run_slither(
+        "/tmp/file.sol",
+        config=ToolSettings(),
+        workdir=tmp_path,
+        log_dir=tmp_path,
+        env={},
+    )
+
+    assert result.parsing_error is None
+    assert (findings[0].file_path, findings[0].line_number, findings[0].function) == (
+        "A.sol",
+        "12",
+        "function",
+    )
+    assert (findings[1].file_path, findings[1].line_number, findings[1].function) == (None, "?", None)
+
+
+def test_mythril_keeps_uint256_values(monkeypatch, tmp_path):
+    max_uint256 = 2**256 - 1
+    stdout_path = tmp_path / "stdout.log"
+    stdout_path.write_text(
+        '{"issues": [{"title": "Integer Overflow", "severity": "High", "swcID": "SWC-101", '
+        f'"lineno": 7, "value": {max_uint256}, "gas": 1.5}}]}}'
+    )
+
+    def fake_run_command(cmd, timeout=10, env=None, workdir=None, log_dir=None, max_runtime=None):  # noqa: ARG001
+        return ToolResult(
+            success=True,
+            output=stdout_path.read_text(),
+            command=cmd,
+            stdout_path=str(stdout_path),
+        )
+
+    monkeypatch.setattr(mythril, "run_command", fake_run_command)
+    result, findings = mythril.run_mythril(
+        "/tmp/file.sol",
+        config=ToolSettings(),
+        workdir=tmp_path,
+        log_dir=tmp_path,
+        env={},
+    )
+
+    assert result.parsing_error is None
+    assert [f.severity for f in findings] == ["HIGH"]
+    assert findings[0].raw["value"] == max_uint256
+    assert findings[0].raw["gas"] == 1.5 and type(findings[0].raw["gas"]) is float
+
+
+def test_foundry_keeps_uint256_values(tmp_path):
+    max_uint256 = 2**256 - 1
+    stdout_path = tmp_path / "stdout.log"
+    stdout_path.write_text(
+        '{"name": "testOverflow", "status": "Failure", "reason": "overflow", '
+        f'"counterexample": {{"amount": {max_uint256}}}}}\n'
+    )
+    result = ToolResult(success=False, output="", stdout_path=str(stdout_path))
+
+    findings = foundry._parse_foundry_output(result)
+
+    assert [f.title for f in findings] == ["testOverflow"]
+    assert findings[0].raw["counterexample"]["amount"] == max_uint256
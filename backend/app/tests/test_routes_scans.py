@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -45,6 +46,7 @@ def setup_database():
     app.dependency_overrides[scans.get_db] = override_get_db
     yield
     app.dependency_overrides.pop(scans.get_db, None)
+    engine.dispose()
     Path("test_routes_scans.db").unlink(missing_ok=True)
 
 
@@ -80,3 +82,110 @@ def test_start_scan_accepts_log_file(monkeypatch, tmp_path: Path, client: TestCl
         assert project.path == str(workspace)
         assert project.meta.get("chain") == "sepolia"
 
+
+
+def test_get_scan_includes_findings(tmp_path: Path, client: TestClient):
+    target = tmp_path / "Sample.sol"
+    target.write_text("contract Sample {}")
+    response = client.post(
+        "/api/scans",
+        json={"project_name": "Detail", "project_path": str(tmp_path), "target": str(target)},
+    )
+    scan_id = response.json()["id"]
+
+    with TestingSessionLocal() as db:
+        db.add(
+            models.Finding(
+                scan_id=scan_id,
+                tool="slither",
+                title="reentrancy",
+                description="desc",
+                severity="HIGH",
+                raw={"check": "reentrancy"},
+            )
+        )
+        db.commit()
+
+    detail = client.get(f"/api/scans/{scan_id}")
+    assert detail.status_code == 200
+    findings = detail.json()["findings"]
+    assert [f["description"] for f in findings] == ["desc"]
+    assert findings[0]["raw"] == {"check": "reentrancy"}
+    assert client.get("/api/scans/0190a1b2-0000-7000-8000-00000000ffff").status_code == 404
+    assert client.get("/api/scans/missing").status_code == 422
+
+    logs = client.get(f"/api/scans/{scan_id}/logs")
+    assert logs.status_code == 200
+    assert logs.json() == {"id": scan_id, "logs": None}
+    assert "logs" not in client.get("/api/scans").json()[0]
+
+
+def test_list_scans_keyset_pagination(tmp_path: Path, client: TestClient):
+    target = tmp_path / "Sample.sol"
+    target.write_text("contract Sample {}")
+    created = [
+        client.post(
+            "/api/scans",
+            json={"project_name": "Paged", "project_path": str(tmp_path), "target": str(target)},
+        ).json()["id"]
+        for _ in range(3)
+    ]
+    # Same timestamp for every scan so the id tie-breaker is exercised.
+    with TestingSessionLocal() as db:
+        db.query(models.Scan).update({"started_at": datetime(2024, 1, 1)})
+        db.commit()
+
+    first = client.get("/api/scans", params={"limit": 2}).json()
+    last = first[-1]
+    second = client.get(
+        "/api/scans",
+        params={"limit": 2, "before": last["started_at"], "before_id": last["id"]},
+    ).json()
+
+    assert [s["id"] for s in first + second] == created[::-1]
+
+
+def test_list_scans_rejects_before_id_without_before(client: TestClient):
+    response = client.get("/api/scans", params={"before_id": "0190a1b2-0000-7000-8000-000000000000"})
+
+    assert response.status_code == 422
+
+
+def test_list_scans_rejects_malformed_cursor(client: TestClient):
+    response = client.get(
+        "/api/scans", params={"before": "2024-01-01T00:00:00", "before_id": "not-a-uuid"}
+    )
+
+    assert response.status_code == 422
+
+
+def test_start_scan_enqueues_task_after_response(monkeypatch, tmp_path: Path):
+    queued: list[str] = []
+    monkeypatch.setattr(scans.run_scan_task, "delay", queued.append)
+    target = tmp_path / "Sample.sol"
+    target.write_text("contract Sample {}")
+
+    response = TestClient(app).post(
+        "/api/scans",
+        json={"project_name": "Queued", "project_path": str(tmp_path), "target": str(target)},
+    )
+
+    assert queued == [response.json()["id"]]
+
+
+def test_quick_scan_upserts_project_by_name(tmp_path: Path, client: TestClient):
+    payload = {
+        "project": {"name": "Quick", "path": str(tmp_path), "meta": {"chain": "sepolia"}},
+        "target": "Sample.sol",
+    }
+    first = client.post("/api/scans/quick", json=payload).json()
+    payload["project"] = {"name": "Quick", "path": str(tmp_path / "moved"), "meta": None}
+    second = client.post("/api/scans/quick", json=payload).json()
+
+    assert first["project_id"] == second["project_id"]
+    assert first["scan_id"] != second["scan_id"]
+    with TestingSessionLocal() as db:
+        projects = db.query(models.Project).filter_by(name="Quick").all()
+        assert len(projects) == 1
+        assert projects[0].path == str(tmp_path / "moved")
+        assert projects[0].meta is None
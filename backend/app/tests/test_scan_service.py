@@ -2,20 +2,30 @@ from datetime import datetime
 import json
 from pathlib import Path
 
+import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.exc import StatementError
 from sqlalchemy.orm import sessionmaker
 
 from app import models
 from app.adapters.base import ToolResult
+from app.db import session as db_session
 from app.db.session import Base
 from app.services import scanner
 from app.normalization.findings import NormalizedFinding
 from app.config import ToolSettings
 
+PROJECT_ID = "00000000-0000-7000-8000-000000000001"
+SCAN_ID = "00000000-0000-7000-8000-000000000002"
+
 
 def setup_sqlite(tmp_path: Path):
     engine = create_engine(
-        f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False}, future=True
+        f"sqlite:///{tmp_path / 'test.db'}",
+        connect_args={"check_same_thread": False},
+        future=True,
+        json_serializer=db_session._json_serializer,
+        json_deserializer=db_session._json_deserializer,
     )
     Base.metadata.create_all(engine)
     return sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
@@ -50,14 +60,14 @@ def test_execute_scan_collects_findings(monkeypatch, tmp_path):
     monkeypatch.setattr(scanner.settings, "tool_settings", {"default": ToolSettings(retries=0)})
 
     db = SessionLocal()
-    project = models.Project(id="p1", name="proj", path=str(tmp_path))
+    project = models.Project(id=PROJECT_ID, name="proj", path=str(tmp_path))
     db.add(project)
     db.commit()
 
     target = tmp_path / "file.sol"
     target.write_text("contract Test {}")
 
-    scan = models.Scan(id="s1", project_id=project.id, target=str(target), tools=["slither"])
+    scan = models.Scan(id=SCAN_ID, project_id=project.id, target=str(target), tools=["slither"])
     db.add(scan)
     db.commit()
     db.refresh(scan)
@@ -86,6 +96,7 @@ def test_execute_scan_collects_findings(monkeypatch, tmp_path):
     assert scan.status == models.ScanStatus.SUCCESS
     findings = db.query(models.Finding).filter(models.Finding.scan_id == scan.id).all()
     assert findings, "findings should be added"
+    assert scan.findings_count == len(findings)
     tool_runs = db.query(models.ToolExecution).filter_by(scan_id=scan.id).all()
     assert tool_runs[0].stdout_path
 
@@ -98,14 +109,14 @@ def test_execute_scan_handles_unknown_tool(monkeypatch, tmp_path):
     monkeypatch.setattr(scanner.settings, "tool_settings", {"default": ToolSettings(retries=0)})
 
     db = SessionLocal()
-    project = models.Project(id="p1", name="proj", path=str(tmp_path))
+    project = models.Project(id=PROJECT_ID, name="proj", path=str(tmp_path))
     db.add(project)
     db.commit()
 
     target = tmp_path / "file.sol"
     target.write_text("contract Test {}")
 
-    scan = models.Scan(id="s1", project_id=project.id, target=str(target), tools=["missing-tool"])
+    scan = models.Scan(id=SCAN_ID, project_id=project.id, target=str(target), tools=["missing-tool"])
     db.add(scan)
     db.commit()
     db.refresh(scan)
@@ -128,14 +139,14 @@ def test_execute_scan_persists_failure_findings(monkeypatch, tmp_path):
     monkeypatch.setattr(scanner.settings, "tool_settings", {"default": ToolSettings(retries=0)})
 
     db = SessionLocal()
-    project = models.Project(id="p1", name="proj", path=str(tmp_path))
+    project = models.Project(id=PROJECT_ID, name="proj", path=str(tmp_path))
     db.add(project)
     db.commit()
 
     target = tmp_path / "file.sol"
     target.write_text("contract Test {}")
 
-    scan = models.Scan(id="s1", project_id=project.id, target=str(target), tools=["manticore"])
+    scan = models.Scan(id=SCAN_ID, project_id=project.id, target=str(target), tools=["manticore"])
     db.add(scan)
     db.commit()
     db.refresh(scan)
@@ -170,13 +181,13 @@ def test_execute_scan_is_idempotent(monkeypatch, tmp_path):
     scanner.settings.fake_results_probability = 0
 
     db = SessionLocal()
-    project = models.Project(id="p1", name="proj", path=str(tmp_path))
+    project = models.Project(id=PROJECT_ID, name="proj", path=str(tmp_path))
     db.add(project)
     db.commit()
 
     scan = models.Scan(
-        id="s1",
-        project_id="p1",
+        id=SCAN_ID,
+        project_id=PROJECT_ID,
         target=str(tmp_path / "file.sol"),
         tools=["slither"],
         status=models.ScanStatus.SUCCESS,
@@ -198,14 +209,14 @@ def test_fake_findings_can_be_injected(monkeypatch, tmp_path):
     monkeypatch.setattr(scanner.settings, "tool_settings", {"default": ToolSettings(retries=0)})
 
     db = SessionLocal()
-    project = models.Project(id="p1", name="proj", path=str(tmp_path))
+    project = models.Project(id=PROJECT_ID, name="proj", path=str(tmp_path))
     db.add(project)
     db.commit()
 
     target = tmp_path / "file.sol"
     target.write_text("contract Test {}")
 
-    scan = models.Scan(id="s1", project_id=project.id, target=str(target), tools=["slither"])
+    scan = models.Scan(id=SCAN_ID, project_id=project.id, target=str(target), tools=["slither"])
     db.add(scan)
     db.commit()
     db.refresh(scan)
@@ -224,3 +235,35 @@ def test_fake_findings_can_be_injected(monkeypatch, tmp_path):
     assert scan.status == models.ScanStatus.SUCCESS
     assert tool_runs[0].status == models.ToolExecutionStatus.SUCCEEDED
     assert findings, "synthetic findings should be stored when injected"
+
+
+def test_store_findings_keeps_wide_integers(tmp_path):
+    SessionLocal = setup_sqlite(tmp_path)
+    db = SessionLocal()
+    db.add(models.Project(id=PROJECT_ID, name="proj", path=str(tmp_path)))
+    db.add(models.Scan(id=SCAN_ID, project_id=PROJECT_ID, target="file.sol", tools=["mythril"]))
+    db.commit()
+
+    finding = NormalizedFinding(
+        tool="mythril",
+        title="Integer Overflow",
+        description="desc",
+        severity="HIGH",
+        raw={"value": 2**256 - 1, "small": 1},
+    )
+    scanner._store_findings(db, SCAN_ID, [finding])
+    db.commit()
+
+    stored = db.query(models.Finding).filter_by(scan_id=SCAN_ID).one()
+    assert stored.raw == {"value": 2**256 - 1, "small": 1}
+    db.close()
+
+
+def test_malformed_foreign_key_is_rejected(tmp_path):
+    SessionLocal = setup_sqlite(tmp_path)
+    db = SessionLocal()
+    db.add(models.Scan(project_id="not-a-uuid", target="file.sol", tools=["slither"]))
+
+    with pytest.raises(StatementError):
+        db.commit()
+    db.close()
@@ -19,3 +19,7 @@ celery_app.autodiscover_tasks(["app"])
 celery_app.conf.task_routes = {
     "app.workers.tasks.*": {"queue": "scans"},
 }
+
+# Scans are long-running: reserve one at a time so a busy worker does not sit on
+# queued scans that an idle worker could pick up (run the worker with -Ofair).
+celery_app.conf.worker_prefetch_multiplier = 1
@@ -9,11 +9,11 @@ from app import models
 from app.services.scanner import execute_scan
 
 
-@celery_app.task(bind=True)
+@celery_app.task(bind=True, ignore_result=True)
 def run_scan_task(self, scan_id: str):
     db: Session = SessionLocal()
     try:
-        scan = db.query(models.Scan).filter(models.Scan.id == scan_id).first()
+        scan = db.get(models.Scan, scan_id)
         if not scan:
             return
         try:
@@ -8,9 +8,26 @@ import typer
 
 API_URL = "http://localhost:8000/api"
 
+PAGE_LIMIT = 500
+
 app = typer.Typer(help="Smart contract scanner CLI")
 
 
+def _get_all_pages(path: str, cursor_field: str) -> list[dict]:
+    """Follow the API's newest-first keyset pagination until a short page comes back."""
+    items: list[dict] = []
+    params: dict = {"limit": PAGE_LIMIT}
+    while True:
+        resp = requests.get(f"{API_URL}{path}", params=params)
+        resp.raise_for_status()
+        page = resp.json()
+        items.extend(page)
+        if len(page) < PAGE_LIMIT:
+            return items
+        last = page[-1]
+        params = {"limit": PAGE_LIMIT, "before": last[cursor_field], "before_id": last["id"]}
+
+
 @app.command()
 def create_project(name: str, path: str):
     resp = requests.post(f"{API_URL}/projects", json={"name": name, "path": path})
@@ -19,8 +36,7 @@ def create_project(name: str, path: str):
 
 @app.command()
 def list_projects():
-    resp = requests.get(f"{API_URL}/projects")
-    typer.echo(resp.json())
+    typer.echo(_get_all_pages("/projects", "created_at"))
 
 
 @app.command()
@@ -62,8 +78,7 @@ def quick_scan(
 
 @app.command()
 def scans():
-    resp = requests.get(f"{API_URL}/scans")
-    typer.echo(resp.json())
+    typer.echo(_get_all_pages("/scans", "started_at"))
 
 
 @app.command()
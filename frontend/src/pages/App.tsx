@@ -124,6 +124,21 @@ const DEFAULT_QUICK_SCAN_FORM = {
   tools: [...TOOLBOX],
 }
 
+// List endpoints are keyset-paginated, newest first: follow the last row's
+// timestamp and id until a short page comes back.
+const PAGE_LIMIT = 500
+const fetchAllPages = async <T extends { id: string },>(path: string, cursorField: keyof T): Promise<T[]> => {
+  const items: T[] = []
+  let params: Record<string, string | number> = { limit: PAGE_LIMIT }
+  for (;;) {
+    const res = await axios.get<T[]>(`${API_URL}${path}`, { params })
+    items.push(...res.data)
+    if (res.data.length < PAGE_LIMIT) return items
+    const last = res.data[res.data.length - 1]
+    params = { limit: PAGE_LIMIT, before: String(last[cursorField]), before_id: last.id }
+  }
+}
+
 const safeLoadJson = <T,>(value: string | null, fallback: T): T => {
   if (!value) return fallback
   try {
@@ -156,18 +171,18 @@ const App: React.FC = () => {
   const loadProjects = useCallback(async () => {
     setLoadingProjects(true)
     try {
-      const res = await axios.get<Project[]>(`${API_URL}/projects`)
-      setProjects(res.data)
+      const data = await fetchAllPages<Project>('/projects', 'created_at')
+      setProjects(data)
       
       setScanForm((prev) => {
-        const hasSelectedProject = res.data.some((p) => p.id === prev.project_id)
+        const hasSelectedProject = data.some((p) => p.id === prev.project_id)
 
-        if (res.data.length === 0) {
+        if (data.length === 0) {
           return prev.project_id ? { ...prev, project_id: '' } : prev
         }
 
         if (!prev.project_id || !hasSelectedProject) {
-          return { ...prev, project_id: res.data[0].id }
+          return { ...prev, project_id: data[0].id }
         }
 
         return prev
@@ -182,8 +197,7 @@ const App: React.FC = () => {
   const loadScans = useCallback(async () => {
     setLoadingScans(true)
     try {
-      const res = await axios.get<ScanSummary[]>(`${API_URL}/scans`)
-      setScans(res.data)
+      setScans(await fetchAllPages<ScanSummary>('/scans', 'started_at'))
     } catch (error) {
       showToast({ tone: 'error', message: 'Failed to load scans' })
     } finally {